@@ -4,6 +4,7 @@
 # License: BSD 2 clause
 
 import time
+import warnings
 from inspect import signature
 from abc import ABC, abstractmethod
 
@@ -16,6 +17,11 @@ from torch_geometric.nn import GIN
 from torch_geometric import compile
 from torch_geometric.loader import NeighborLoader
 
+try:
+    from torch._dynamo.exc import TorchDynamoException
+except ImportError:  # torch without dynamo, nothing is compiled lazily
+    TorchDynamoException = ()
+
 from ..utils import logger, validate_device, pprint, is_fitted
 
 
@@ -425,6 +431,7 @@ class DeepDetector(Detector, ABC):
         if save_emb:
             self.emb = None
         self.compile_model = compile_model
+        self._eager_model = None
 
     def fit(self, data, label=None):
 
@@ -438,7 +445,7 @@ class DeepDetector(Detector, ABC):
 
         self.model = self.init_model(**self.kwargs)
         if self.compile_model:
-            self.model = compile(self.model)
+            self._compile()
         if not self.gan:
             optimizer = torch.optim.Adam(self.model.parameters(),
                                          lr=self.lr,
@@ -462,7 +469,11 @@ class DeepDetector(Detector, ABC):
                 batch_size = sampled_data.batch_size
                 node_idx = sampled_data.n_id
 
-                loss, score = self.forward_model(sampled_data)
+                loss, score = self._run_compiled(self._train_step,
+                                                 sampled_data,
+                                                 optimizer)
+                optimizer.step()
+
                 epoch_loss += loss.item() * batch_size
                 if self.save_emb:
                     if type(self.emb) is tuple:
@@ -475,10 +486,6 @@ class DeepDetector(Detector, ABC):
                             self.model.emb[:batch_size].cpu()
                 self.decision_score_[node_idx[:batch_size]] = score
 
-                optimizer.zero_grad()
-                loss.backward()
-                optimizer.step()
-
             loss_value = epoch_loss / data.x.shape[0]
             if self.gan:
                 loss_value = (self.epoch_loss_in / data.x.shape[0], loss_value)
@@ -493,6 +500,47 @@ class DeepDetector(Detector, ABC):
         self._process_decision_score()
         return self
 
+    def _compile(self):
+        """
+        Compile the model, keeping the eager model as a fallback.
+        """
+        self._eager_model = self.model
+        try:
+            self.model = compile(self.model)
+        except RuntimeError as e:
+            self._fallback_to_eager(e)
+
+    def _fallback_to_eager(self, error):
+        warnings.warn('Failed to compile the model, falling back '
+                      'to eager mode: {}'.format(error))
+        self.model = self._eager_model
+        self._eager_model = None
+
+    def _run_compiled(self, func, *args):
+        """
+        Run ``func`` on the model. The compiled model is only built
+        lazily by its forward and backward passes, so a compiler
+        backend failure in ``func`` falls back to the eager model and
+        reruns ``func``. Any other error is raised as is.
+        """
+        try:
+            return func(*args)
+        except TorchDynamoException as e:
+            if self._eager_model is None:
+                raise
+            self._fallback_to_eager(e)
+            return func(*args)
+
+    def _train_step(self, data, optimizer):
+        """
+        Forward and backward pass of a training batch. The optimizer
+        step is left to the caller.
+        """
+        output = self.forward_model(data)
+        optimizer.zero_grad()
+        output[0].backward()
+        return output
+
     def decision_function(self, data, label=None):
 
         self.process_graph(data)
@@ -511,7 +559,8 @@ class DeepDetector(Detector, ABC):
         start_time = time.time()
         test_loss = 0
         for sampled_data in loader:
-            loss, score = self.forward_model(sampled_data)
+            loss, score = self._run_compiled(self.forward_model,
+                                             sampled_data)
             batch_size = sampled_data.batch_size
             node_idx = sampled_data.n_id
             if self.save_emb:
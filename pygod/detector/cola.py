@@ -129,6 +129,9 @@ class CoLA(DeepDetector):
         if self.save_emb:
             self.emb = torch.zeros(self.num_nodes,
                                    self.hid_dim)
+        # contrastive labels of a full batch, reused by every batch
+        self._con_label = torch.zeros(2, self.batch_size, device=self.device)
+        self._con_label[0] = 1
         return CoLABase(in_dim=self.in_dim,
                         hid_dim=self.hid_dim,
                         num_layers=self.num_layers,
@@ -144,10 +147,9 @@ class CoLA(DeepDetector):
         edge_index = data.edge_index.to(self.device)
 
         pos_logits, neg_logits = self.model(x, edge_index)
-        logits = torch.cat([pos_logits[:batch_size],
-                            neg_logits[:batch_size]])
-        con_label = torch.cat([torch.ones(batch_size),
-                               torch.zeros(batch_size)]).to(self.device)
+        logits = torch.stack([pos_logits[:batch_size],
+                              neg_logits[:batch_size]])
+        con_label = self._con_label[:, :batch_size]
 
         loss = self.model.loss_func(logits, con_label)
 
@@ -5,7 +5,6 @@ with Data Augmentation (CONAD)"""
 # License: BSD 2 clause
 
 import torch
-import numpy as np
 from copy import deepcopy
 from torch_geometric.nn import GCN
 from torch_geometric.utils import dense_to_sparse
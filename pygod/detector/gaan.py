@@ -6,8 +6,6 @@
 import torch
 import warnings
 import torch.nn.functional as F
-from torch_geometric.nn import MLP
-from torch_geometric.utils import to_dense_adj
 
 from ..nn import GAANBase
 from . import DeepDetector
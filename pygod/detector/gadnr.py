@@ -10,7 +10,6 @@ import torch
 import torch.nn.functional as F
 from torch_geometric.loader import NeighborLoader
 from torch_geometric.nn import GCN
-from torch_geometric import compile
 
 from . import DeepDetector
 from ..nn import GADNRBase
@@ -309,7 +308,7 @@ class GADNR(DeepDetector):
             self.full_batch = False
         self.model = self.init_model(**self.kwargs)
         if self.compile_model:
-            self.model = compile(self.model)
+            self._compile()
         
         degree_params = list(map(id, self.model.degree_decoder.parameters()))
         base_params = filter(lambda p: id(p) not in degree_params,
@@ -336,7 +335,7 @@ class GADNR(DeepDetector):
             # full batch training
             if self.full_batch:
                 loss, loss_per_node, h_loss, degree_loss, feature_loss = \
-                                                self.forward_model(data) 
+                    self._run_compiled(self._train_step, data, optimizer)
 
                 comp_loss = self.comp_decision_score(loss_per_node,
                                                      h_loss,
@@ -351,8 +350,6 @@ class GADNR(DeepDetector):
                 if self.save_emb:
                     self.emb = self.model.emb.cpu()
                 
-                optimizer.zero_grad()
-                loss.backward()
                 optimizer.step()
 
                 epoch_loss = loss.item() * self.batch_size 
@@ -364,7 +361,9 @@ class GADNR(DeepDetector):
                     sampled_data = self.process_graph(sampled_data)
 
                     loss, loss_per_node, h_loss, degree_loss, feature_loss = \
-                                            self.forward_model(sampled_data)
+                        self._run_compiled(self._train_step,
+                                           sampled_data,
+                                           optimizer)
                     
                     comp_loss = self.comp_decision_score(loss_per_node,
                                                          h_loss,
@@ -381,8 +380,6 @@ class GADNR(DeepDetector):
                         self.emb[node_idx[:batch_size]] = \
                             self.model.emb[:batch_size].cpu()
                     
-                    optimizer.zero_grad()
-                    loss.backward()
                     optimizer.step()
 
                     epoch_loss += loss.item() * batch_size
@@ -442,7 +439,7 @@ class GADNR(DeepDetector):
         start_time = time.time()
         if self.batch_size == data.x.shape[0]: # full batch inference
             loss, loss_per_node, h_loss, degree_loss, feature_loss = \
-                                            self.forward_model(data) 
+                self._run_compiled(self.forward_model, data)
             comp_loss = self.comp_decision_score(loss_per_node,
                                                  h_loss,
                                                  degree_loss,
@@ -459,7 +456,7 @@ class GADNR(DeepDetector):
                 node_idx = sampled_data.n_id
                 sampled_data = self.process_graph(sampled_data)
                 loss, loss_per_node, h_loss, degree_loss, feature_loss = \
-                                        self.forward_model(sampled_data)
+                    self._run_compiled(self.forward_model, sampled_data)
                 comp_loss = self.comp_decision_score(loss_per_node,
                                                      h_loss,
                                                      degree_loss,
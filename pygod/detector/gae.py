@@ -160,12 +160,14 @@ class GAE(DeepDetector):
         edge_index = data.edge_index.to(self.device)
 
         if self.recon_s:
-            s = data.s.to(self.device)[:, node_idx]
+            # only the target rows of the sampled block are needed, so
+            # slice on the host before copying to the device
+            s = data.s[:batch_size, node_idx].to(self.device)
 
         h = self.model(x, edge_index)
 
-        target = s if self.recon_s else x
-        score = torch.mean(self.model.loss_func(target[:batch_size],
+        target = s if self.recon_s else x[:batch_size]
+        score = torch.mean(self.model.loss_func(target,
                                                 h[:batch_size],
                                                 reduction='none'), dim=1)
 
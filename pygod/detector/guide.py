@@ -4,7 +4,6 @@
 # Author: Kay Liu <zliu234@uic.edu>
 # License: BSD 2 clause
 
-import os
 import warnings
 
 import torch
@@ -116,9 +116,10 @@ class Radar(Detector):
         s = torch.max(s, s.T)
         laplacian = torch.diag(torch.sum(s, dim=1)) - s
 
-        w_init = torch.eye(x.shape[0]).to(self.device)
+        w_init = torch.eye(x.shape[0], device=self.device)
         r_init = torch.inverse((1 + self.weight_decay) *
-            torch.eye(x.shape[0]).to(self.device) + self.gamma * laplacian) @ x
+            torch.eye(x.shape[0], device=self.device) +
+            self.gamma * laplacian) @ x
 
         return x, s, laplacian, w_init, r_init
 
@@ -78,8 +78,10 @@ class CoLABase(nn.Module):
             Discriminator logits of negative examples.
         """
         self.emb = self.encoder(x, edge_index)
-        logits = self.discriminator(x, self.emb)
 
-        perm_idx = torch.randperm(x.shape[0]).to(x.device)
-        neg_logits = self.discriminator(x[perm_idx], self.emb)
-        return logits.squeeze(), neg_logits.squeeze()
+        # score positive and shuffled negative pairs in one bilinear call
+        perm_idx = torch.randperm(x.shape[0], device=x.device)
+        logits = self.discriminator(torch.cat([x, x[perm_idx]]),
+                                    self.emb.repeat(2, 1)).squeeze(-1)
+        logits, neg_logits = logits.split(x.shape[0])
+        return logits, neg_logits
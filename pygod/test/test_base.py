@@ -1,8 +1,61 @@
 # -*- coding: utf-8 -*-
 import unittest
+from unittest.mock import patch
+
+import torch
+from torch._dynamo.exc import TorchDynamoException
+
 from pygod.detector import DOMINANT
 
 
+class FailingBackward(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx, x):
+        return x.clone()
+
+    @staticmethod
+    def backward(ctx, grad):
+        raise TorchDynamoException('backward compilation failed')
+
+
+class CompiledStub(torch.nn.Module):
+    # stands in for a lazily compiled model that fails on use
+    error = None
+    fail_backward = False
+
+    def __init__(self, model):
+        super(CompiledStub, self).__init__()
+        self.model = model
+
+    @property
+    def loss_func(self):
+        return self.model.loss_func
+
+    @property
+    def emb(self):
+        return self.model.emb
+
+    def forward(self, *args, **kwargs):
+        if self.error is not None:
+            raise self.error
+        x_, s_ = self.model(*args, **kwargs)
+        if self.fail_backward:
+            x_ = FailingBackward.apply(x_)
+        return x_, s_
+
+
+class ForwardFailure(CompiledStub):
+    error = TorchDynamoException('backend compiler failed')
+
+
+class BackwardFailure(CompiledStub):
+    fail_backward = True
+
+
+class ModelFailure(CompiledStub):
+    error = ValueError('shape mismatch')
+
+
 class TestBase(unittest.TestCase):
 
     def test_contamination(self):
@@ -19,3 +72,29 @@ class TestBase(unittest.TestCase):
         with self.assertRaises(ValueError):
             DOMINANT(num_neigh='1, 2, 3')
 
+    def test_compile_fallback(self):
+        data = torch.load('pygod/test/train_graph.pt')
+
+        # failure when wrapping the model
+        with patch('pygod.detector.base.compile',
+                   side_effect=RuntimeError('unsupported platform')):
+            detector = DOMINANT(epoch=1, compile_model=True)
+            with self.assertWarnsRegex(UserWarning, 'Failed to compile'):
+                detector.fit(data)
+        self.assertEqual(detector.decision_score_.shape[0], data.num_nodes)
+
+        # failures deferred to the forward or backward pass
+        for stub in [ForwardFailure, BackwardFailure]:
+            with patch('pygod.detector.base.compile', stub):
+                detector = DOMINANT(epoch=1, compile_model=True)
+                with self.assertWarnsRegex(UserWarning, 'Failed to compile'):
+                    detector.fit(data)
+            self.assertNotIsInstance(detector.model, CompiledStub)
+            self.assertEqual(detector.decision_score_.shape[0],
+                             data.num_nodes)
+
+        # other errors are not mistaken for compilation failures
+        with patch('pygod.detector.base.compile', ModelFailure):
+            detector = DOMINANT(epoch=1, compile_model=True)
+            with self.assertRaises(ValueError):
+                detector.fit(data)
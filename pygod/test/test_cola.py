@@ -5,6 +5,7 @@ from numpy.testing import assert_equal
 from numpy.testing import assert_raises
 
 import torch
+from torch_geometric.data import Data
 from torch_geometric.nn import GIN
 from torch_geometric.seed import seed_everything
 
@@ -114,3 +115,15 @@ class TestCoLA(unittest.TestCase):
             detector.predict(self.test_data,
                              return_prob=True,
                              prob_method='something')
+
+    def test_single_node_batch(self):
+        # node 4 is isolated, so its batch holds a single node
+        data = Data(x=torch.randn(5, 8),
+                    edge_index=torch.tensor([[0, 1, 1, 2, 2, 3],
+                                             [1, 0, 2, 1, 3, 2]]))
+        detector = CoLA(epoch=2, num_layers=2, hid_dim=4, batch_size=1)
+        detector.fit(data)
+
+        score = detector.predict(data, return_pred=False, return_score=True)
+        assert_equal(score.shape[0], data.num_nodes)
+        assert (torch.isfinite(score).all())